@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
+from datetime import timedelta
 
 class Video(models.Model):
     title = models.CharField(max_length=255)
@@ -9,3 +11,32 @@ class Video(models.Model):
 
     def __str__(self):
         return self.title
+
+class PromptDraft(models.Model):
+    creator = models.ForeignKey(User, on_delete=models.CASCADE)
+    age = models.PositiveIntegerField()
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    # Drafts only hold intermediate prompt text, so they are discarded once
+    # they are older than this.
+    expiry = timedelta(days=1)
+
+    def __str__(self):
+        return 'Draft %d' % self.pk
+
+    @classmethod
+    def delete_expired(cls):
+        cls.objects.filter(created__lt=timezone.now() - cls.expiry).delete()
+
+class PromptSegment(models.Model):
+    draft = models.ForeignKey(PromptDraft, on_delete=models.CASCADE, related_name='segments')
+    index = models.PositiveIntegerField()
+    source = models.TextField()
+    text = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['index']
+        unique_together = [('draft', 'index')]
+
+    def __str__(self):
+        return '%s, segment %d' % (self.draft, self.index)
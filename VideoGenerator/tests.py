@@ -1,3 +1,87 @@
 from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from unittest import mock
+from .models import PromptDraft, PromptSegment
 
-# Create your tests here.
+class PromptDraftTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('parent', password='password')
+        self.client.force_login(self.user)
+
+    def create_draft(self, user=None):
+        draft = PromptDraft.objects.create(creator=user or self.user, age=10)
+        PromptSegment.objects.create(draft=draft, index=0, source='First')
+        PromptSegment.objects.create(draft=draft, index=1, source='Second')
+        return draft
+
+    def test_video_prompt_creates_segments(self):
+        resp = self.client.post(reverse('video_prompt'), {
+            'api_prompt': 'First\r\n\r\nSecond\r\n\r\nThird',
+            'age': 12,
+        })
+        self.assertEqual(resp.status_code, 200)
+        draft = PromptDraft.objects.get(creator=self.user)
+        self.assertEqual(draft.age, 12)
+        self.assertEqual([s.source for s in draft.segments.all()],
+                         ['First', 'Second', 'Third'])
+
+    def test_video_prompt_deletes_expired_drafts(self):
+        old = self.create_draft()
+        PromptDraft.objects.filter(pk=old.pk).update(
+            created=old.created - PromptDraft.expiry * 2)
+        self.client.post(reverse('video_prompt'), {'api_prompt': 'First', 'age': 12})
+        self.assertFalse(PromptDraft.objects.filter(pk=old.pk).exists())
+        self.assertFalse(PromptSegment.objects.filter(draft_id=old.pk).exists())
+
+    def test_prompt_segment_round_trip(self):
+        draft = self.create_draft()
+        url = reverse('prompt_segment', args=[draft.id, 1])
+        resp = self.client.post(url, {'prompt': 'Edited text'})
+        self.assertEqual(resp.status_code, 200)
+        resp = self.client.get(url)
+        self.assertEqual(resp.json(), {'index': 1, 'source': 'Second',
+                                       'prompt': 'Edited text'})
+
+    def test_other_users_draft_not_found(self):
+        other = User.objects.create_user('other', password='password')
+        draft = self.create_draft(user=other)
+        url = reverse('prompt_segment', args=[draft.id, 0])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.post(url, {'prompt': 'x'}).status_code, 404)
+        load_url = reverse('load_prompt', args=[draft.id, 0])
+        self.assertEqual(self.client.post(load_url).status_code, 404)
+        self.assertEqual(PromptSegment.objects.get(draft=draft, index=0).text, '')
+
+    @mock.patch('VideoGenerator.views.parse_prompt', return_value=['One', 'Two'])
+    def test_load_prompt(self, parse_prompt):
+        draft = self.create_draft()
+        session = self.client.session
+        session['openai_key'] = 'sk-test'
+        session.save()
+        resp = self.client.post(reverse('load_prompt', args=[draft.id, 0]))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {'msg': ['One', 'Two']})
+        parse_prompt.assert_called_once_with('sk-test', 'First', 10)
+        self.assertEqual(PromptSegment.objects.get(draft=draft, index=0).text,
+                         'One\n\nTwo')
+
+    @mock.patch('VideoGenerator.views.parse_prompt')
+    def test_load_prompt_without_key(self, parse_prompt):
+        draft = self.create_draft()
+        resp = self.client.post(reverse('load_prompt', args=[draft.id, 0]))
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn('error', resp.json())
+        parse_prompt.assert_not_called()
+
+    def test_load_prompt_requires_post(self):
+        draft = self.create_draft()
+        resp = self.client.get(reverse('load_prompt', args=[draft.id, 0]))
+        self.assertEqual(resp.status_code, 405)
+
+    def test_video_prompt_clears_session_key(self):
+        self.client.post(reverse('video_prompt'), {
+            'api_prompt': 'First', 'age': 12, 'openai_key': 'sk-test'})
+        self.assertEqual(self.client.session['openai_key'], 'sk-test')
+        self.client.post(reverse('video_prompt'), {'api_prompt': 'First', 'age': 12})
+        self.assertNotIn('openai_key', self.client.session)
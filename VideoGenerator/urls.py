@@ -7,5 +7,6 @@ urlpatterns = [
     path('new/', views.video_generator, name='video_generator'),
     path('prompt/', views.video_prompt, name='video_prompt'),
     path('segments/', views.video_prompts, name='video_prompts'),
-    path('load_prompt/<int:prompt_id>/', views.load_prompt, name='load_prompt')
+    path('load_prompt/<int:draft_id>/<int:index>/', views.load_prompt, name='load_prompt'),
+    path('drafts/<int:draft_id>/<int:index>/', views.prompt_segment, name='prompt_segment'),
 ]
@@ -1,16 +1,15 @@
 #!/usr/bin/python3
-from openai import OpenAI, InternalServerError, RateLimitError
-from mutagen.mp3 import MP3
-from moviepy import editor
 import os
-import requests
 from tempfile import NamedTemporaryFile
-import validators
 from urllib.request import urlopen
-from bs4 import BeautifulSoup
 from time import sleep
 import logging
 
+# The media and API stacks (openai, moviepy, mutagen, bs4, requests and
+# validators) are slow to import, so they are imported within the functions
+# that use them. This keeps Django startup (manage.py, workers, tests) from
+# paying for them until a video is actually being generated.
+
 class VideoBlock:
     def __init__(self, client, paragraph_input, logger):
         self.client = client
@@ -21,6 +20,8 @@ class VideoBlock:
         self.video = None
 
     def choose_image(self, fname):
+        import requests
+        import validators
         # Is it a url, or a local filename?
         if validators.url(fname):
             img_data = requests.get(fname).content
@@ -32,6 +33,8 @@ class VideoBlock:
             self.image = fname
 
     def generate_image(self):
+        from openai import InternalServerError, RateLimitError
+        import requests
         # Generate images until the user decides it is sufficient
         try:
             response = self.client.images.generate(
@@ -52,6 +55,7 @@ class VideoBlock:
             w.write(img_data)
 
     def generate_audio(self):
+        from openai import InternalServerError, RateLimitError
         # Generate the spoken audio
         try:
             response = self.client.audio.speech.create(
@@ -67,6 +71,8 @@ class VideoBlock:
             self.audio = t.name
 
     def generate_video(self):
+        from moviepy import editor
+        from mutagen.mp3 import MP3
         video = editor.ImageClip(self.image)
         audio = MP3(self.audio)
         audio_length = audio.info.length
@@ -99,6 +105,7 @@ class VideoGenerator():
 
     @openai_key.setter
     def openai_key(self, value):
+        from openai import OpenAI
         self._openai_key = value
         self.client = OpenAI(api_key=self._openai_key)
 
@@ -119,6 +126,7 @@ class VideoGenerator():
         return prompt_msg
 
     def parse_prompt_from_url(self, prompt_url):
+        from bs4 import BeautifulSoup
         html = urlopen(prompt_url).read()
         soup = BeautifulSoup(html, features="html.parser")
         for script in soup(["script", "style"]):
@@ -181,6 +189,7 @@ class VideoGenerator():
         return self._append_videos()
 
     def _append_videos(self):
+        from moviepy import editor
         with NamedTemporaryFile('w', delete=False, suffix='.mp4') as t:
             output_filename = t.name
         video_files = [editor.VideoFileClip(c.video) for c in self.final_content]
@@ -193,6 +202,7 @@ class VideoGenerator():
         return output_filename
 
     def _prompt_message(self, prompt):
+        from openai import InternalServerError, RateLimitError
         try:
             chat_completion = self.client.chat.completions.create(
                 messages=[
@@ -212,6 +222,7 @@ class VideoGenerator():
 logger = logging.getLogger(__name__)
 
 def prompt_message(client, prompt):
+    from openai import InternalServerError, RateLimitError
     try:
         chat_completion = client.chat.completions.create(
             messages=[
@@ -229,6 +240,7 @@ def prompt_message(client, prompt):
         return chat_completion.choices[0].message.content
 
 def parse_prompt_from_url(prompt_url):
+    from bs4 import BeautifulSoup
     html = urlopen(prompt_url).read()
     soup = BeautifulSoup(html, features="html.parser")
     for script in soup(["script", "style"]):
@@ -239,6 +251,7 @@ def parse_prompt_from_url(prompt_url):
     return prompt
 
 def parse_prompt(openai_key, prompt, age):
+    from openai import OpenAI
     client = OpenAI(api_key=openai_key)
     final_content = []
     audiance_type = 'a child' if age < 18 else 'an adult'
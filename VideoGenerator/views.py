@@ -1,12 +1,12 @@
 from django.shortcuts import render, get_object_or_404
 from django.http import HttpResponse
-from .models import Video
+from .models import Video, PromptDraft, PromptSegment
 from django.contrib.auth.decorators import login_required
 from .vidmaker import parse_prompt_from_url, parse_prompt
 from django.conf import settings
 from django import forms
-from urllib.parse import parse_qs
 from django.http import JsonResponse
+from django.views.decorators.http import require_POST
 
 @login_required
 def video_list(request):
@@ -89,51 +89,56 @@ def video_prompt(request):
             age = form.cleaned_data['age']
             api_prompt = form.cleaned_data['api_prompt']
             prompts = api_prompt.replace('\r', '').split('\n\n')
-            initial = { 'hidden_prompt%d' % i: prompts[i] for i in range(0, len(prompts))}
-            initial['age'] = age
+            # Keep the segments server side, so the browser only sends the
+            # draft id and the segment being changed.
+            PromptDraft.delete_expired()
+            draft = PromptDraft.objects.create(creator=request.user, age=age)
+            PromptSegment.objects.bulk_create([
+                PromptSegment(draft=draft, index=i, source=prompts[i])
+                for i in range(0, len(prompts))
+            ])
+            # The user's OpenAI key is kept in their session (and therefore in
+            # the session store on the server) so that load_prompt can use it.
             openai_key = form.cleaned_data['openai_key']
-            if not openai_key:
-                openai_key = settings.OPENAI_API_KEY
             if settings.OPENAI_API_KEY == None and openai_key:
-                initial['openai_key'] = openai_key
-            form = PromptsForm(openai_key_set=settings.OPENAI_API_KEY != None,
-                              initial=initial, num_prompts=len(prompts))
-            return render(request, 'videos/video_prompts.html', {'form': form})
+                request.session['openai_key'] = openai_key
+            else:
+                request.session.pop('openai_key', None)
+            form = PromptsForm(initial={'draft_id': draft.id})
+            return render(request, 'videos/video_prompts.html',
+                          {'form': form, 'draft': draft,
+                           'segments': draft.segments.all()})
 
 class PromptsForm(forms.Form):
-    openai_key = forms.CharField(
-        label='OpenAI API key',
-        required=False,
-        help_text='Requesting an OpenAI API key is explained in <a href="https://platform.openai.com/docs/quickstart/step-2-setup-your-api-key">the OpenAPI docs</a>.'
-    )
-    age = forms.IntegerField(
+    draft_id = forms.IntegerField(
         widget=forms.HiddenInput(),
         required=True,
     )
 
-    def __init__(self, *args, **kwargs):
-        openai_key_set = kwargs.pop('openai_key_set', False)
-        if openai_key_set:
-            self.fields.pop('openai_key')
-        num_prompts = kwargs.pop('num_prompts', 0)
-        super(PromptsForm, self).__init__(*args, **kwargs)
-        for i in range(0, num_prompts):
-            self.fields['hidden_prompt%d' % i] = forms.CharField(
-                widget=forms.HiddenInput()
-            )
-            self.fields['prompt%d' % i] = forms.CharField(
-                label='',
-                widget=forms.Textarea(attrs={'rows': 6, 'cols': 80}),
-                required=True
-            )
+def get_segment(request, draft_id, index):
+    return get_object_or_404(PromptSegment.objects.select_related('draft'), draft__pk=draft_id,
+                             draft__creator=request.user, index=index)
+
+@login_required
+@require_POST
+def load_prompt(request, draft_id, index):
+    segment = get_segment(request, draft_id, index)
+    openai_key = settings.OPENAI_API_KEY or request.session.get('openai_key')
+    if not openai_key:
+        return JsonResponse({'error': 'An OpenAI API key is required.'}, status=400)
+    resp = parse_prompt(openai_key, segment.source, segment.draft.age)
+    segment.text = '\n\n'.join(resp)
+    segment.save(update_fields=['text'])
+    return JsonResponse({'msg': resp})
 
-#def parse_prompt(openai_key, prompt, age):
 @login_required
-def load_prompt(request, prompt_id):
+def prompt_segment(request, draft_id, index):
+    segment = get_segment(request, draft_id, index)
     if request.method == 'POST':
-        params = parse_qs(request.body.decode('utf-8'))
-        resp = parse_prompt(params['openai_key'][0], params['prompt'][0], int(params['age'][0]))
-        return JsonResponse({'msg': resp})
+        segment.text = request.POST.get('prompt', '')
+        segment.save(update_fields=['text'])
+    return JsonResponse({'index': segment.index, 'source': segment.source,
+                         'prompt': segment.text})
 
 @login_required
 def video_prompts(request):
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""Measure startup time of `manage.py check` and `server --help`.
+
+The media and API stacks are imported lazily by VideoGenerator/vidmaker.py and
+the server CLI. This times each command as it is, and again with the heavy
+modules imported before the command runs (as they were when they were imported
+at module load). The difference is the startup time saved by the lazy imports.
+It also reports which heavy modules each command imported (via
+`python -X importtime`).
+"""
+from importlib.util import find_spec
+from pathlib import Path
+from statistics import median
+from subprocess import run, PIPE, DEVNULL
+import argparse
+import os
+import sys
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ['moviepy.editor', 'openai', 'mutagen.mp3', 'bs4', 'requests', 'validators']
+
+COMMANDS = {
+    'manage.py check': [str(ROOT / 'manage.py'), 'check'],
+    'server --help': [str(ROOT / 'server'), '--help'],
+}
+
+class CommandError(Exception):
+    pass
+
+def run_python(args):
+    return run([sys.executable] + args, cwd=ROOT, stdout=DEVNULL, stderr=PIPE,
+               universal_newlines=True, env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'))
+
+def time_command(args, runs):
+    times = []
+    for _ in range(runs):
+        start = perf_counter()
+        proc = run_python(args)
+        times.append(perf_counter() - start)
+        if proc.returncode != 0:
+            raise CommandError('Command failed: %s\n%s' % (' '.join(args), proc.stderr))
+    return median(times)
+
+def preloaded(args, modules):
+    # Import the modules, then run the script as __main__ in the same process
+    code = 'import sys, runpy; import %s; sys.argv = %r; runpy.run_path(sys.argv[0], run_name="__main__")'
+    return ['-c', code % (', '.join(modules), args)]
+
+def imported_heavy_modules(args):
+    # -X importtime writes one line per imported module to stderr
+    proc = run_python(['-X', 'importtime'] + args)
+    if proc.returncode != 0:
+        raise CommandError('Command failed: %s\n%s' % (' '.join(args), proc.stderr))
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        imported.add(line.rsplit('|', 1)[1].strip())
+    return [m for m in HEAVY_MODULES if m in imported]
+
+def available_modules():
+    return [m for m in HEAVY_MODULES if find_spec(m.split('.')[0]) is not None]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark TinyTutor startup time')
+    parser.add_argument('--runs', help='Number of runs per measurement', type=int, default=5)
+    parser.add_argument('--no-eager', help='Skip timing the commands with the heavy modules preloaded',
+                        action='store_true')
+    args = parser.parse_args()
+
+    modules = [] if args.no_eager else available_modules()
+    if not args.no_eager:
+        missing = [m for m in HEAVY_MODULES if m not in modules]
+        if not modules:
+            print('None of the heavy modules are installed, skipping the eager measurement')
+        elif missing:
+            print('Not installed, left out of the eager measurement: %s' % ', '.join(missing))
+
+    failed = False
+    for name, command in COMMANDS.items():
+        try:
+            lazy_time = time_command(command, args.runs)
+            heavy = imported_heavy_modules(command)
+            eager_time = time_command(preloaded(command, modules), args.runs) if modules else None
+        except CommandError as e:
+            sys.stderr.write('%s: %s\n' % (name, e))
+            failed = True
+            continue
+        print('%s: %.3fs (median of %d runs)' % (name, lazy_time, args.runs))
+        if heavy:
+            print('  heavy modules imported at startup: %s' % ', '.join(heavy))
+        if eager_time is not None:
+            print('  with heavy modules preloaded: %.3fs, lazy imports save %.3fs'
+                  % (eager_time, eager_time - lazy_time))
+    if failed:
+        sys.exit(1)